@@ -1,12 +1,57 @@
+import hashlib
 import json
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from importlib import metadata
 from pathlib import Path
 from jsonschema import Draft7Validator
+import jsonschema_rs
+import orjson
 from typing import Union
 import logging
 
 PATH_TO_SHEMA = Path('./schema')
 PATH_TO_EVENT = Path('./event')
+PATH_TO_SCHEMA_CACHE = Path('./.cache/schemas.json')
+PATH_TO_RESULTS_CACHE = Path('./.cache/results.json')
+
+logger = logging.getLogger('json_validator')
+
+# Последовательность цифр, которая может быть целым числом вне 64 бит.
+_LONG_NUMBER = re.compile(rb'\d{19}')
+
+# Кеш проверенных валидаторов, ключ - хеш содержимого схемы.
+_validators_cache = {}
+# Кеш результатов проверки данных, ключ - хеш схемы и хеш файла.
+_results_cache = {}
+
+# Проверка ключевого слова format, как в jsonschema.Draft7Validator.
+VALIDATE_FORMATS = False
+
+
+def get_package_version(name: str) -> str:
+    """
+    Функция возвращает версию установленного пакета.
+    :param name: Название пакета.
+    :return: Возвращает строку версии или 'unknown'.
+    """
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+# Результаты из кеша используются, только если движки и их настройки
+# совпадают с теми, которыми они были получены.
+RESULTS_ENGINE = (
+    f"jsonschema-rs {get_package_version('jsonschema-rs')}; "
+    f"jsonschema {get_package_version('jsonschema')}; "
+    f"validate_formats={VALIDATE_FORMATS}"
+)
 
 
 class UnknownError:
@@ -26,30 +71,106 @@ class CorruptedSchema:
     def __str__(self):
         return f"Схема некорректна: {self.error}"
 
+    def __reduce__(self):
+        # Исключения схем не всегда сериализуются, в дочерние процессы
+        # передаётся только текст ошибки.
+        return CorruptedSchema, (str(self.error),)
 
-def remove_empty_from_dict(d: Union[dict, list, None]) -> Union[dict, list]:
-    """Функция удаляет пустые значения в массиве."""
-    if type(d) is dict:
-        _temp = {}
-        for k, v in d.items():
-            if v is None or v == "":
+
+class SchemaValidator:
+    """
+    Класс проверенной схемы, хешируемый по содержимому схемы.
+    Проверка данных выполняется скомпилированным валидатором jsonschema-rs.
+    Схемы и данные, которые jsonschema-rs не представляет без потерь
+    (NaN, Infinity, строки с одиночными суррогатами), проверяются
+    jsonschema.Draft7Validator.
+    """
+    __slots__ = ('hash', 'schema', 'validator', 'py_validator')
+
+    def __init__(self, schema_hash: str, json_schema: dict):
+        self.hash = schema_hash
+        self.schema = json_schema
+        self.validator = None
+        self.py_validator = None
+        if fits_rust(json_schema):
+            try:
+                # Как и jsonschema.Draft7Validator, ключевое слово format
+                # не проверяется.
+                self.validator = jsonschema_rs.Draft7Validator(
+                    json_schema, validate_formats=VALIDATE_FORMATS)
+            except Exception:
+                # Схема уже прошла check_schema, её проверит jsonschema.
                 pass
-            elif type(v) is int or type(v) is float:
-                _temp[k] = remove_empty_from_dict(v)
-            elif v or remove_empty_from_dict(v):
-                _temp[k] = remove_empty_from_dict(v)
-        return _temp
-    elif type(d) is list:
-        return [
-            remove_empty_from_dict(v)
-            for v in d if (
-                    (str(v).strip() or str(remove_empty_from_dict(v)).strip())
-                    and (v is not None or remove_empty_from_dict(
-                v) is not None)
-            )
-        ]
-    else:
+
+    def __hash__(self):
+        return hash(self.hash)
+
+    def __reduce__(self):
+        # В дочерний процесс передаётся только схема, валидатор
+        # пересобирается там через кеш.
+        return restore_validator, (self.hash, self.schema)
+
+    def get_engine(self, rust_compatible: bool = True):
+        """
+        Метод возвращает валидатор для проверки данных.
+        :param rust_compatible: Данные представимы в jsonschema-rs.
+        :return: Возвращает валидатор jsonschema-rs или jsonschema.
+        """
+        if rust_compatible and self.validator is not None:
+            return self.validator
+        if self.py_validator is None:
+            self.py_validator = Draft7Validator(self.schema)
+        return self.py_validator
+
+
+# Функции обхода для типов контейнеров: пары (ключ, значение).
+_CONTAINER_ITEMS = {dict: dict.items, list: enumerate}
+
+
+def _new_node(container_type: type) -> tuple:
+    """
+    Функция создаёт пустой очищенный узел.
+    :param container_type: Тип исходного контейнера.
+    :return: Возвращает узел и функцию добавления в него по ключу.
+    """
+    if container_type is dict:
+        node = {}
+        return node, node.__setitem__
+    node = []
+    append = node.append
+    return node, lambda key, value: append(value)
+
+
+def remove_empty_from_dict(d: Union[dict, list, None]) -> Union[dict, list]:
+    """
+    Функция удаляет пустые значения в массиве.
+    Обход выполняется без рекурсии, каждый узел обрабатывается один раз.
+    Удаляются None, пустые строки и контейнеры, пустые после очистки.
+    """
+    get_items = _CONTAINER_ITEMS.get(type(d))
+    if get_items is None:
         return d
+    result, put = _new_node(type(d))
+    # Элемент стека: (итератор исходного узла, очищенный узел,
+    # функция добавления в узел, функция добавления в родителя, ключ).
+    stack = [(iter(get_items(d)), result, put, None, None)]
+    while stack:
+        items, node, put, parent_put, parent_key = stack[-1]
+        for key, value in items:
+            value_type = type(value)
+            get_items = _CONTAINER_ITEMS.get(value_type)
+            if get_items is not None:
+                child, child_put = _new_node(value_type)
+                stack.append((iter(get_items(value)), child, child_put,
+                              put, key))
+                break
+            if value is not None and value != "":
+                put(key, value)
+        else:
+            stack.pop()
+            if parent_put is not None and node:
+                parent_put(parent_key, node)
+    return result
 
 
 def validate_path() -> bool:
@@ -59,33 +180,240 @@ def validate_path() -> bool:
     return is_event_path and is_schema_path
 
 
-def schema_loader() -> dict:
+def get_schema_hash(json_schema: dict) -> str:
+    """
+    Функция вычисляет хеш содержимого схемы.
+    :param json_schema: Словарь схемы.
+    :return: Возвращает sha256 от канонического JSON схемы.
+    """
+    dump = json.dumps(json_schema, sort_keys=True)
+    return hashlib.sha256(dump.encode()).hexdigest()
+
+
+def get_validator(json_schema: dict) -> SchemaValidator:
+    """
+    Функция возвращает валидатор схемы из кеша или создаёт новый.
+    :param json_schema: Словарь схемы.
+    :return: Возвращает объект SchemaValidator.
+    """
+    schema_hash = get_schema_hash(json_schema)
+    validator = _validators_cache.get(schema_hash)
+    if validator is None:
+        Draft7Validator.check_schema(json_schema)
+        validator = SchemaValidator(schema_hash, json_schema)
+        _validators_cache[schema_hash] = validator
+    return validator
+
+
+def restore_validator(schema_hash: str, json_schema: dict) -> SchemaValidator:
+    """
+    Функция восстанавливает уже проверенный валидатор схемы.
+    :param schema_hash: Хеш содержимого схемы.
+    :param json_schema: Словарь схемы.
+    :return: Возвращает объект SchemaValidator.
+    """
+    validator = _validators_cache.get(schema_hash)
+    if validator is None:
+        validator = SchemaValidator(schema_hash, json_schema)
+        _validators_cache[schema_hash] = validator
+    return validator
+
+
+def list_files(directory: Path) -> list:
+    """
+    Функция получает список файлов каталога за один проход os.scandir.
+    :param directory: Путь к каталогу.
+    :return: Возвращает список кортежей (имя файла без расширения, путь).
+    """
+    with os.scandir(directory) as entries:
+        return [
+            (os.path.splitext(entry.name)[0], entry.path)
+            for entry in entries if entry.is_file()
+        ]
+
+
+def load_json_cache(path: Path) -> dict:
+    """
+    Функция загружает с диска кеш в формате JSON.
+    :param path: Путь к файлу кеша.
+    :return: Возвращает словарь кеша или пустой словарь.
+    """
+    try:
+        cache = parse_json(read_file(path))
+    except Exception:
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_json_cache(path: Path, cache: dict):
+    """
+    Функция атомарно сохраняет на диск кеш в формате JSON.
+    Используется модуль json: в схемах могут быть NaN и целые числа
+    вне 64 бит, которые orjson не сохраняет без потерь.
+    :param path: Путь к файлу кеша.
+    :param cache: Словарь кеша.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as file:
+        # ensure_ascii экранирует и одиночные суррогаты, которые нельзя
+        # записать в UTF-8.
+        file.write(json.dumps(cache).encode('ascii'))
+    os.replace(tmp_path, path)
+
+
+def restore_cached_validator(entry, stat: os.stat_result):
+    """
+    Функция восстанавливает валидатор из записи кеша схем.
+    :param entry: Запись кеша схем для файла или None.
+    :param stat: Результат os.stat для файла схемы.
+    :return: Возвращает SchemaValidator или None, если запись устарела
+    или повреждена.
+    """
+    if not isinstance(entry, dict):
+        return None
+    if (entry.get('mtime_ns') != stat.st_mtime_ns
+            or entry.get('size') != stat.st_size):
+        return None
+    try:
+        return restore_validator(entry['hash'], entry['schema'])
+    except Exception:
+        return None
+
+
+def load_schema(schema_file: tuple, cached: dict) -> tuple:
+    """
+    Функция загрузки одной схемы.
+    Неизменённая с прошлого запуска схема берётся из кеша на диске
+    без повторного чтения и проверки.
+    :param schema_file: Кортеж из имени файла схемы и пути к нему.
+    :param cached: Словарь кеша схем, загруженный с диска.
+    :return: Возвращает кортеж из имени схемы, записи кеша и валидатора
+    либо CorruptedSchema с записью None.
+    """
+    filename, schema_path = schema_file
+    try:
+        stat = os.stat(schema_path)
+        validator = restore_cached_validator(cached.get(filename), stat)
+        if validator is None:
+            json_schema = parse_json(read_file(schema_path))
+            validator = get_validator(json_schema)
+    except Exception as err:
+        return filename, None, CorruptedSchema(err)
+    entry = {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'hash': validator.hash,
+        'schema': validator.schema,
+    }
+    return filename, entry, validator
+
+
+def schema_loader() -> tuple:
     """
     Функция загрузки схемы
-    :return: Возвращает словарь со схемами.
+    Схемы читаются и компилируются параллельно в пуле потоков.
+    :return: Возвращает словарь со схемами и словарь с текстами ошибок
+    поврежденных схем.
     """
     schemas = {}
-    for schema_path in PATH_TO_SHEMA.iterdir():
-        filename = schema_path.stem
+    corrupted = {}
+    cached = load_json_cache(PATH_TO_SCHEMA_CACHE)
+    cache = {}
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        loaded = executor.map(
+            partial(load_schema, cached=cached),
+            list_files(PATH_TO_SHEMA)
+        )
+        for filename, entry, schema in loaded:
+            schemas[filename] = schema
+            if entry is None:
+                corrupted[filename] = f'{schema}'
+            else:
+                cache[filename] = entry
+    if cache != cached:
         try:
-            with open(schema_path, 'r', encoding='utf8') as schema:
-                json_schema = json.load(schema)
-                Draft7Validator.check_schema(json_schema)
-                schemas[filename] = Draft7Validator(json_schema)
-        except Exception as err:
-            schemas[filename] = CorruptedSchema(err)
-    return schemas
+            save_json_cache(PATH_TO_SCHEMA_CACHE, cache)
+        except OSError as err:
+            logger.warning('Не удалось сохранить кеш схем: %s', err)
+    return schemas, corrupted
 
 
-def reader(path: str) -> dict:
+def read_file(path: Union[str, Path]) -> bytes:
     """
-    Функция читает файлы по заданному пути.
+    Функция читает содержимое файла целиком.
+    Размер буфера берётся из fstat, поэтому для обычного файла
+    выполняются только open, fstat, один read и close.
     :param path: Путь к файлу.
-    :return: Возвращает словарь с данными из файла.
+    :return: Возвращает байты файла.
     """
-    with open(path, 'r', encoding='utf-8') as file:
-        result = json.load(file)
-    return result
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # Короткое чтение возможно только на нестандартных файловых системах.
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return data
+
+
+def decode_json(raw: bytes) -> tuple:
+    """
+    Функция разбирает JSON из байтов.
+    orjson не принимает NaN, Infinity и одиночные суррогаты и превращает
+    целые числа вне 64 бит в float. В этих случаях JSON разбирается
+    модулем json, как и раньше.
+    :param raw: Байты JSON документа в кодировке UTF-8.
+    :return: Возвращает разобранный объект и признак того, что его
+    можно передавать в jsonschema-rs.
+    """
+    if not _LONG_NUMBER.search(raw):
+        try:
+            return orjson.loads(raw), True
+        except orjson.JSONDecodeError:
+            pass
+    value = json.loads(raw.decode('utf-8'))
+    return value, fits_rust(value)
+
+
+def parse_json(raw: bytes):
+    """
+    Функция разбирает JSON из байтов.
+    :param raw: Байты JSON документа в кодировке UTF-8.
+    :return: Возвращает разобранный объект.
+    """
+    return decode_json(raw)[0]
+
+
+def fits_rust(value) -> bool:
+    """
+    Функция проверяет, что значение передаётся в jsonschema-rs без потерь.
+    :param value: Разобранный JSON объект.
+    :return: Возвращает False, если в значении есть NaN, Infinity
+    или строки, не кодируемые в UTF-8.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item)
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, float):
+            if not math.isfinite(item):
+                return False
+        elif isinstance(item, str) and not item.isascii():
+            try:
+                item.encode('utf-8')
+            except UnicodeEncodeError:
+                return False
+    return True
 
 
 def check_event_key(event: str) -> list:
@@ -112,7 +440,7 @@ def check_schema_key(name: str, schemas: dict) -> list:
     errors = []
     if schemas.get(name) is None:
         errors.append('Указанной схемы не существует.')
-    elif schemas[name] is CorruptedSchema:
+    elif isinstance(schemas[name], CorruptedSchema):
         errors.append('В указанной схеме выявлены ошибки')
     return errors
 
@@ -128,68 +456,196 @@ def check_data_key(data):
     return errors
 
 
-def run_checker(schemas: dict) -> dict:
+def check_event_file(event_file: tuple, schemas: dict) -> tuple:
+    """
+    Функция проверки одного JSON файла на соответствие указанной схеме.
+    Непредвиденная ошибка при проверке попадает в отчёт этого файла и
+    не прерывает проверку остальных.
+    :param event_file: Кортеж из имени JSON файла и пути к нему.
+    :param schemas: Словарь со схемами.
+    :return: Возвращает кортеж из имени файла, списка ошибок и ключа
+    кеша результата (None, если данные не проверялись по схеме).
+    """
+    try:
+        return check_event(event_file, schemas)
+    except Exception as err:
+        name = event_file[0]
+        logger.exception('Ошибка при проверке файла %s', name)
+        return name, [f'Ошибка при проверке файла: {err!r}'], None
+
+
+def check_event(event_file: tuple, schemas: dict) -> tuple:
+    """
+    Функция проверок JSON файла, вызываемая из check_event_file.
+    :param event_file: Кортеж из имени JSON файла и пути к нему.
+    :param schemas: Словарь со схемами.
+    :return: Возвращает кортеж из имени файла, списка ошибок и ключа
+    кеша результата (None, если данные не проверялись по схеме).
+    """
+    name, event_path = event_file
+    file_error_list = []
+    try:
+        raw = read_file(event_path)
+        event_json, rust_compatible = decode_json(raw)
+    except Exception:
+        file_error_list.append('Данный файл не соответствует формату JSON')
+        return name, file_error_list, None
+    if not isinstance(event_json, dict):
+        file_error_list.append(
+            'Файл должен содержать словарь с данными в формате JSON')
+        return name, file_error_list, None
+
+    event_errors = check_event_key(event_json.get("event"))
+    file_error_list.extend(event_errors)
+
+    data_errors = check_data_key(event_json.get("data"))
+    file_error_list.extend(data_errors)
+
+    if not event_errors:
+        schema_name_errors = check_schema_key(event_json["event"], schemas)
+        file_error_list.extend(schema_name_errors)
+
+        if not (schema_name_errors or data_errors):
+            validator = schemas[event_json["event"]]
+            result_key = f'{validator.hash}:{hashlib.sha256(raw).hexdigest()}'
+            file_error_list.extend(
+                check_data(event_json['data'], validator, result_key,
+                           rust_compatible)
+            )
+            return name, file_error_list, result_key
+    return name, file_error_list, None
+
+
+def load_results_cache() -> dict:
+    """
+    Функция загружает с диска кеш результатов проверки.
+    :return: Возвращает словарь результатов или пустой словарь, если кеш
+    получен другими версиями или настройками валидаторов.
+    """
+    cache = load_json_cache(PATH_TO_RESULTS_CACHE)
+    results = cache.get('results')
+    if cache.get('engine') != RESULTS_ENGINE or not isinstance(results, dict):
+        return {}
+    return results
+
+
+def setup_logger():
+    """
+    Функция настройки объекта логирования.
+    Повторный вызов не добавляет обработчики, если они уже есть.
+    """
+    if logger.handlers:
+        return
+    f_handler = logging.FileHandler('logfile.log')
+    # Настройка логера.
+    logger.setLevel(logging.DEBUG)
+    c_handler = logging.StreamHandler()
+    c_handler.setLevel(logging.INFO)
+    f_handler.setLevel(logging.DEBUG)
+    f_format = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    f_handler.setFormatter(f_format)
+    c_handler.setFormatter(f_format)
+    logger.addHandler(f_handler)
+    logger.addHandler(c_handler)
+
+
+def init_worker(configure_logger: bool, results: dict):
+    """
+    Функция инициализации дочернего процесса пула.
+    При запуске через spawn или forkserver процесс не выполняет блок
+    __main__, поэтому логер настраивается здесь.
+    :param configure_logger: Настроен ли логер в основном процессе.
+    :param results: Кеш результатов проверки с прошлого запуска.
+    """
+    if configure_logger:
+        setup_logger()
+    _results_cache.update(results)
+
+
+def run_checker(schemas: dict, corrupted: dict) -> dict:
     """
-    Функция проверки соответствия JSON файла указанной схеме.
+    Функция проверки соответствия JSON файлов указанным схемам.
+    Файлы проверяются параллельно в пуле процессов.
     :param schemas: Словарь со схемами.
+    :param corrupted: Словарь с текстами ошибок поврежденных схем.
     :return: result Возвращает словарь ошибок.
     """
-    files_paths = list(PATH_TO_EVENT.iterdir())
-    errors = {path.stem: [] for path in files_paths}
-    for event_path in files_paths:
-        file_error_list = errors[event_path.stem]
+    files_paths = list_files(PATH_TO_EVENT)
+    errors = {}
+    cached_results = load_results_cache()
+    results = {}
+    chunksize = max(1, len(files_paths) // (os.cpu_count() or 1))
+    with ProcessPoolExecutor(
+            initializer=init_worker,
+            initargs=(bool(logger.handlers), cached_results)
+    ) as executor:
+        checked = executor.map(
+            partial(check_event_file, schemas=schemas),
+            files_paths,
+            chunksize=chunksize
+        )
+        for name, file_errors, result_key in checked:
+            errors[name] = file_errors
+            # Ключ есть только у файлов, прошедших все проверки до схемы,
+            # поэтому список ошибок совпадает с результатом check_data.
+            if result_key is not None:
+                results[result_key] = file_errors
+    if results != cached_results:
         try:
-            event_json = reader(f"{event_path}")
-        except Exception:
-            file_error_list.append('Данный файл не соответствует формату JSON')
-            continue
-        if not isinstance(event_json, dict):
-            file_error_list.append(
-                'Файл должен содержать словарь с данными в формате JSON')
-            continue
-
-        event_errors = check_event_key(event_json.get("event"))
-        file_error_list.extend(event_errors)
-
-        data_errors = check_data_key(event_json.get("data"))
-        file_error_list.extend(data_errors)
-
-        if not event_errors:
-            schema_name_errors = check_schema_key(event_json["event"], schemas)
-            file_error_list.extend(schema_name_errors)
-
-            if not (schema_name_errors or data_errors):
-                file_error_list.extend(
-                    check_data(
-                        event_json['data'],
-                        schemas[event_json["event"]]
-                    )
-                )
+            save_json_cache(PATH_TO_RESULTS_CACHE, {
+                'engine': RESULTS_ENGINE,
+                'results': results,
+            })
+        except OSError as err:
+            logger.warning('Не удалось сохранить кеш результатов: %s', err)
     result = {
-        "schema_errors": {
-            k: f'{v}' for k, v in schemas.items() if
-            isinstance(v, CorruptedSchema)
-        },
+        "schema_errors": corrupted,
         "json_errors": errors
     }
 
-    logger.info(result)
+    # Словарь результата может быть большим: форматируется лениво и
+    # только для файла лога.
+    logger.debug('Результат проверки: %r', result)
     return result
 
 
-def check_data(data: dict, validator: Draft7Validator) -> list:
+def validate_data(data: dict, validator: SchemaValidator,
+                  rust_compatible: bool = True) -> list:
+    """
+    Проверка данных валидатором схемы.
+    :param data: Словарь данных из JSON файла.
+    :param validator: Объект SchemaValidator.
+    :param rust_compatible: Данные можно передавать в jsonschema-rs.
+    :return: Возвращает отсортированный список найденных ошибок.
+    """
+    engine = validator.get_engine(rust_compatible)
+    # Проверка до первой ошибки без создания объектов ошибок.
+    if engine.is_valid(data):
+        return []
+    messages = [error.message for error in engine.iter_errors(data)]
+    messages.sort()
+    return messages
+
+
+def check_data(data: dict, validator: SchemaValidator, result_key: str,
+               rust_compatible: bool = True) -> list:
     """
     Проверка значения data на соответствие схеме.
+    Результат берётся из кеша, если файл с той же схемой уже проверялся.
     :param data: Словарь данных из JSON файла.
-    :param validator: Объект Draft7Validator.
+    :param validator: Объект SchemaValidator.
+    :param result_key: Ключ кеша: хеш схемы и хеш содержимого файла.
+    :param rust_compatible: Данные можно передавать в jsonschema-rs.
     :return: result Возвращает список найденных ошибок.
     """
-    result = [
-        error.message
-        for error in sorted(validator.iter_errors(data), key=str)
-    ]
+    result = _results_cache.get(result_key)
+    if not isinstance(result, list):
+        result = validate_data(data, validator, rust_compatible)
+        _results_cache[result_key] = result
+    result = list(result)
     if result:
-        logger.info(result)
+        logger.info('%s', result)
     return result
 
 
@@ -202,16 +658,18 @@ def make_report(result: dict) -> list:
     res = [f"Проведена проверка {datetime.now()}\n", "\n"]
     if "schema_errors" in result:
         res.append(f"Выявлены ошибки схемы:\n")
-        for name, error in result["schema_errors"].items():
-            res.append(f"\tВ схеме {name} обнаружены ошибки:\n")
-            res.append(f"\t{error}\n")
+        res.extend([
+            f"\tВ схеме {name} обнаружены ошибки:\n\t{error}\n"
+            for name, error in result["schema_errors"].items()
+        ])
     if "json_errors" in result:
         res.append(f"Выявлены ошибки JSON файла:\n")
-        for name, errors in result["json_errors"].items():
-            res.append(f"\tВ файле {name} обнаружены ошибки:\n")
-            for error in errors:
-                res.append(f"\t{error}\n")
-    logger.info(res)
+        res.extend([
+            f"\tВ файле {name} обнаружены ошибки:\n"
+            + "".join([f"\t{error}\n" for error in errors])
+            for name, errors in result["json_errors"].items()
+        ])
+    logger.debug('Отчёт: %r', res)
     return res
 
 
@@ -221,8 +679,12 @@ def write_report(result: list):
     :param result: Список, содержащий отчет.
     :return: Возвращает файл с записанным результатом.
     """
-    with open('report.txt', 'w+', encoding='utf-8') as file:
-        file.writelines(result)
+    report = ''.join(result)
+    # Сохраняем перевод строк текстового режима для текущей ОС.
+    if os.linesep != '\n':
+        report = report.replace('\n', os.linesep)
+    with open('report.txt', 'wb') as file:
+        file.write(report.encode('utf-8'))
 
 
 def main():
@@ -231,9 +693,9 @@ def main():
     # Проверка путей.
     validate_path()
     # Загрузка файлов схем.
-    schemas = schema_loader()
+    schemas, corrupted = schema_loader()
     # Запуск функции проверки соответствия.
-    result = run_checker(schemas)
+    result = run_checker(schemas, corrupted)
     # Удаление пустых строк из результирующего словаря.
     res = remove_empty_from_dict(result)
     # Создание отчёта.
@@ -243,19 +705,7 @@ def main():
 
 
 if __name__ == '__main__':
-    # Создание объекта логирования.
-    logger = logging.getLogger('json_validator')
-    f_handler = logging.FileHandler('logfile.log')
-    # Настройка логера.
-    logger.setLevel(logging.DEBUG)
-    c_handler = logging.StreamHandler()
-    c_handler.setLevel(logging.INFO)
-    f_handler.setLevel(logging.DEBUG)
-    f_format = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    f_handler.setFormatter(f_format)
-    c_handler.setFormatter(f_format)
-    logger.addHandler(f_handler)
-    logger.addHandler(c_handler)
+    # Настройка объекта логирования.
+    setup_logger()
     # Вызов запуска скрипта.
     main()